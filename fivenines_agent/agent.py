@@ -8,12 +8,13 @@ import platform
 import psutil
 import signal
 import socket
+from concurrent.futures import ThreadPoolExecutor
 
 from fivenines_agent.env import debug_mode
 from fivenines_agent.cpu import cpu_data, cpu_model
 from fivenines_agent.ip import get_ip
 from fivenines_agent.network import network
-from fivenines_agent.partitions import partitions_metadata, partitions_usage
+from fivenines_agent.partitions import partitions
 from fivenines_agent.processes import processes
 from fivenines_agent.disks import io
 from fivenines_agent.files import file_handles_used, file_handles_limit
@@ -84,8 +85,7 @@ class Agent:
                 data['file_handles_limit'] = file_handles_limit()
 
                 if self.config['ping']:
-                    for region, host in self.config['ping'].items():
-                        data[f'ping_{region}'] = self.tcp_ping(host)
+                    data.update(self.ping_regions(self.config['ping']))
 
                 if self.config['cpu']:
                     data['cpu'] = cpu_data()
@@ -106,8 +106,7 @@ class Agent:
                     data['network'] = network()
 
                 if self.config['partitions']:
-                    data['partitions_metadata'] = partitions_metadata()
-                    data['partitions_usage'] = partitions_usage()
+                    data['partitions_metadata'], data['partitions_usage'] = partitions()
 
                 if self.config['io']:
                     data['io'] = io()
@@ -142,6 +141,11 @@ class Agent:
             print(f'Sleeping for {sleep_time} seconds')
         time.sleep(sleep_time)
 
+    def ping_regions(self, regions):
+        with ThreadPoolExecutor(max_workers=min(8, len(regions))) as executor:
+            results = executor.map(self.tcp_ping, regions.values())
+            return { f'ping_{region}': ms for region, ms in zip(regions, results) }
+
     def tcp_ping(self, host, port=80, timeout=5):
         if debug_mode():
             print(f"Pinging {host}:{port} with timeout {timeout} seconds")
@@ -1,6 +1,8 @@
 import psutil
 import os
-import platform
+from functools import lru_cache
+
+from fivenines_agent.env import OPERATING_SYSTEM
 
 def cpu_data():
     cpu_times_percent = psutil.cpu_times_percent(percpu=True)
@@ -15,9 +17,9 @@ def cpu_data():
     return cores_usage
 
 
+@lru_cache(maxsize=None)
 def cpu_model():
-    operating_system = platform.system()
-    if operating_system == 'Linux':
+    if OPERATING_SYSTEM == 'Linux':
         try:
             with open('/proc/cpuinfo', 'r') as f:
                 for line in f:
@@ -25,7 +27,7 @@ def cpu_model():
                         return line.split(':')[1].strip()
         except FileNotFoundError:
             return '-'
-    elif operating_system == 'Darwin':
+    elif OPERATING_SYSTEM == 'Darwin':
         try:
             with os.popen('/usr/sbin/sysctl -n machdep.cpu.brand_string') as f:
                 return f.read().strip()
@@ -1,4 +1,7 @@
 import os
+import platform
+
+OPERATING_SYSTEM = platform.system()
 
 def api_url():
   return os.environ.get('API_URL', 'api.fivenines.io')
@@ -1,4 +1,4 @@
-import platform
+from fivenines_agent.env import OPERATING_SYSTEM
 
 def file_handles_used():
     file_handles_stats()[0]
@@ -8,9 +8,7 @@ def file_handles_limit():
 
 
 def file_handles_stats():
-    operating_system = platform.system()
-
-    if operating_system != 'Linux':
+    if OPERATING_SYSTEM != 'Linux':
         return [0, 0, 0]
     else:
         try:
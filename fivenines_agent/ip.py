@@ -5,6 +5,9 @@ import ssl
 import http.client
 
 from fivenines_agent.env import debug_mode
+
+SSL_CONTEXT = ssl.create_default_context()
+
 class CustomHTTPSConnection(http.client.HTTPSConnection):
     def __init__(self, host, port=None, ipv6=False, timeout=5, **kwargs):
         super().__init__(host, port, timeout=timeout, **kwargs)
@@ -31,9 +34,7 @@ class CustomHTTPSConnection(http.client.HTTPSConnection):
 
 def get_ip(ipv6=False):
     try:
-        context = ssl.create_default_context()
-
-        conn = CustomHTTPSConnection("ip.fivenines.io", ipv6=ipv6, context=context)
+        conn = CustomHTTPSConnection("ip.fivenines.io", ipv6=ipv6, context=SSL_CONTEXT)
         conn.request("GET", "")
         response = conn.getresponse()
         body = response.read().decode("utf-8")
@@ -1,11 +1,27 @@
 import os
-import platform
 import psutil
 
+from fivenines_agent.env import OPERATING_SYSTEM
+
+SYS_CLASS_NET = '/sys/class/net'
+
 def interfaces(operating_system):
     if operating_system == 'Linux':
-        with os.popen('ls -l /sys/class/net/ | grep -v virtual | grep devices | rev | cut -d "/" -f1 | rev') as f:
-            return f.read().strip().split('\n')
+        physical_interfaces = []
+        try:
+            names = os.listdir(SYS_CLASS_NET)
+        except OSError:
+            return physical_interfaces
+
+        for name in names:
+            try:
+                target = os.readlink(os.path.join(SYS_CLASS_NET, name))
+            except OSError:
+                continue
+            if 'devices' in target and 'virtual' not in target:
+                physical_interfaces.append(name)
+
+        return physical_interfaces
     elif operating_system == 'Darwin':
         with os.popen('scutil --nwi | grep "Network interfaces" | cut -d " " -f3') as f:
             return f.read().strip().split('\n')
@@ -14,7 +30,7 @@ def interfaces(operating_system):
 
 def network():
     network = []
-    network_interfaces = interfaces(platform.system())
+    network_interfaces = interfaces(OPERATING_SYSTEM)
 
     for k, v in psutil.net_io_counters(pernic=True).items():
         if k not in network_interfaces:
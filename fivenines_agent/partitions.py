@@ -1,13 +1,14 @@
 import psutil
 
-IGNORED_DEVICES = ['/loop', '/snap']
-IGNORED_FS = ['squashfs', 'cagefs-skeleton']
+IGNORED_DEVICES = ('/loop', '/snap')
+IGNORED_FS = frozenset(['squashfs', 'cagefs-skeleton'])
 
-def partitions_metadata():
+def partitions():
     partitions_metadata = []
+    partitions_usage = {}
 
-    for part in psutil.disk_partitions(False):
-        if part.device.startswith(tuple(IGNORED_DEVICES)):
+    for part in psutil.disk_partitions(all=False):
+        if part.device.startswith(IGNORED_DEVICES):
             continue
 
         if part.fstype in IGNORED_FS:
@@ -19,19 +20,6 @@ def partitions_metadata():
             'fstype': part.fstype,
             'opts': part.opts,
         })
+        partitions_usage[part.mountpoint] = psutil.disk_usage(part.mountpoint)._asdict()
 
-    return partitions_metadata
-
-def partitions_usage():
-    partitions_usage = {}
-
-    for _, v in enumerate(psutil.disk_partitions(all=False)):
-        if v.device.startswith(tuple(IGNORED_DEVICES)):
-            continue
-
-        if v.fstype in IGNORED_FS:
-            continue
-
-        partitions_usage[v.mountpoint] = psutil.disk_usage(v.mountpoint)._asdict()
-
-    return partitions_usage
+    return partitions_metadata, partitions_usage
@@ -9,7 +9,20 @@ METRICS = '\|'.join([
   '^db[0-9]'
 ])
 
+CRLF_TABLE = str.maketrans('', '', '\r\n')
+PORT_RANGE = range(1, 65536)
+
+def strip_crlf(value):
+    return value.translate(CRLF_TABLE) if isinstance(value, str) else value
+
 def redis_metrics(port=6379, password=None):
+    if isinstance(port, str) and port.isascii() and port.isdigit():
+      port = int(port)
+
+    if not isinstance(port, int) or isinstance(port, bool) or port not in PORT_RANGE:
+      print(f'Invalid redis port: {port}', file=sys.stderr)
+      return None
+
     redis_installed = False
     if os.system('which redis-server > /dev/null') == 0:
       redis_installed = True
@@ -18,6 +31,7 @@ def redis_metrics(port=6379, password=None):
       return None
 
     auth_prefix = ''
+    password = strip_crlf(password)
     if password:
       auth_prefix = f'AUTH {password}\n'
 
@@ -2,18 +2,22 @@ import time
 import http.client
 import json
 import gzip
+import random
+import ssl
+from email.utils import parsedate_to_datetime
 from threading import Thread
-from threading import Lock
 
 from fivenines_agent.env import debug_mode, api_url
 
+RETRY_MAX_INTERVAL = 60
+
 class Synchronizer(Thread):
     def __init__(self, token, queue):
         Thread.__init__(self)
-        self.config_lock = Lock()
         self.token = token
         self.config = { 'enabled': False, 'request_options': { 'timeout': 5, 'retry': 3, 'retry_interval': 5 } }
         self.queue = queue
+        self.conn = None
 
         self.send_request({'get_config': True})
 
@@ -28,7 +32,7 @@ class Synchronizer(Thread):
 
     def send_request(self, data):
         try_count = 0
-        compressed_data = gzip.compress(json.dumps(data).encode('utf-8'))
+        compressed_data = gzip.compress(json.dumps(data, separators=(',', ':')).encode('utf-8'), compresslevel=6)
         headers = {
             'Content-Type': 'application/json',
             'Content-Encoding': 'gzip',
@@ -37,29 +41,87 @@ class Synchronizer(Thread):
         }
 
         while try_count < self.config['request_options']['retry']:
+            retry_after = None
             try:
                 start_time = time.monotonic()
-                conn = http.client.HTTPSConnection(
-                    api_url(), timeout=self.config['request_options']['timeout'])
-                res = conn.request('POST', '/collect', compressed_data, headers)
-                res = conn.getresponse()
+                res = self.post(compressed_data, headers)
                 body = res.read().decode("utf-8")
 
                 if res.status == 200:
                     if debug_mode():
                         print(f'Sync time: {time.monotonic() - start_time}')
                     config = json.loads(body)['config']
-                    with self.config_lock:
-                        self.config = config
+                    # Publish the new config with a single reference swap so
+                    # readers never need to take a lock.
+                    self.config = config
                     break
                 else:
+                    retry_after = self.retry_after(res)
                     raise Exception(f'HTTP {res.status}: {body}')
             except Exception as e:
+                self.close_conn()
                 try_count += 1
                 print(f'Synchronizer Error: {e}')
-                print(f'Retrying in {self.config["request_options"]["retry_interval"] * try_count} seconds')
-                time.sleep(self.config['request_options']['retry_interval'] * try_count)
+                retry_delay = self.retry_delay(try_count, retry_after)
+                print(f'Retrying in {retry_delay:.2f} seconds')
+                time.sleep(retry_delay)
+
+    def post(self, body, headers):
+        try:
+            return self.request(body, headers)
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError,
+                ssl.SSLEOFError, ssl.SSLZeroReturnError):
+            # The API dropped the idle keep-alive connection, reconnect once
+            self.close_conn()
+            return self.request(body, headers)
+
+    def request(self, body, headers):
+        conn = self.get_conn()
+        conn.request('POST', '/collect', body, headers)
+        return conn.getresponse()
+
+    def get_conn(self):
+        if self.conn is None:
+            self.conn = http.client.HTTPSConnection(api_url())
+        timeout = self.config['request_options']['timeout']
+        self.conn.timeout = timeout
+        # The timeout attribute is only read on connect, so apply it to an
+        # already open keep-alive socket as well.
+        if self.conn.sock is not None:
+            self.conn.sock.settimeout(timeout)
+        return self.conn
+
+    def close_conn(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    # Truncated exponential backoff with full jitter, so that agents failing
+    # at the same time do not retry against the API in lockstep. A delay
+    # requested by the API through Retry-After takes precedence.
+    def retry_delay(self, try_count, retry_after=None):
+        request_options = self.config['request_options']
+        max_interval = request_options.get('retry_max_interval', RETRY_MAX_INTERVAL)
+        if retry_after is not None:
+            return min(max_interval, retry_after)
+
+        backoff = request_options['retry_interval'] * 2 ** (try_count - 1)
+        return random.uniform(0, min(max_interval, backoff))
+
+    def retry_after(self, res):
+        value = res.getheader('Retry-After')
+        if value is None:
+            return None
+
+        try:
+            return max(0, int(value))
+        except ValueError:
+            pass
+
+        try:
+            return max(0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
 
     def get_config(self):
-        with self.config_lock:
-            return self.config
+        return self.config